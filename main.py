@@ -1,24 +1,67 @@
+import asyncio  # Run independent database calls concurrently
+import logging  # Report non-fatal startup problems
 import os  # Read environment variables and build filesystem paths
-import io  # Wrap raw bytes in a stream for StreamingResponse
-from datetime import datetime
-from typing import Optional
+import socket  # Host name for naming upload queue consumers
+from contextlib import asynccontextmanager
+from typing import List, Literal, Optional
+from urllib.parse import quote  # Percent-encode non-ASCII filenames for Content-Disposition
 
 import certifi  # Provides an up-to-date CA bundle (helps TLS in some serverless environments)
 from bson import ObjectId  # MongoDB's native id type
+from bson.codec_options import CodecOptions, TypeDecoder, TypeRegistry  # Custom BSON decoding
+from bson.errors import InvalidId  # Raised by ObjectId() for malformed ids
 from dotenv import load_dotenv  # Loads env vars from a .env file
-from fastapi import FastAPI, File, UploadFile, HTTPException  # FastAPI core + file upload primitives
-from fastapi.responses import StreamingResponse, JSONResponse  # Streams bytes back; JSONResponse for custom error handling
-from pymongo.errors import ServerSelectionTimeoutError  # Raised when MongoDB can't be reached
-from pydantic import BaseModel, EmailStr, Field  # Request validation + schema generation
+from fastapi import Body, FastAPI, File, Query, Request, UploadFile, HTTPException  # FastAPI core + file upload primitives
+from fastapi.middleware.gzip import GZipMiddleware  # Compresses JSON responses
+from fastapi.responses import Response, StreamingResponse, JSONResponse, ORJSONResponse  # Streams bytes back; JSONResponse for custom error handling; ORJSONResponse for fast JSON
+from pymongo import WriteConcern  # Per-collection write acknowledgement settings
+from pymongo.errors import PyMongoError, ServerSelectionTimeoutError  # Raised when MongoDB can't be reached
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter  # Request validation + schema generation
 import motor.motor_asyncio  # Async MongoDB driver (Motor)
+import orjson  # Fast JSON encoding for cached responses
+import redis.asyncio as aioredis  # Async Redis client (optional read cache)
+from redis.exceptions import RedisError, ResponseError  # Raised when Redis can't be reached / rejects a command
 
 # Load environment variables from .env file (from this project directory)
 # This makes local development easy without hard-coding secrets into code.
 _dotenv_path = os.path.join(os.path.dirname(__file__), ".env")
 load_dotenv(dotenv_path=_dotenv_path)
 
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Runs once before the first request is served.
+    await warm_up_connection()
+    await ensure_indexes()
+    worker = asyncio.create_task(upload_worker()) if queue_uploads else None
+    yield
+    if worker is not None:
+        worker.cancel()
+
+
 # Create the FastAPI application (Swagger UI available at /docs)
-app = FastAPI(title="Event Management API")
+# ORJSONResponse serializes responses with orjson (C implementation) instead of the stdlib json module.
+app = FastAPI(title="Event Management API", default_response_class=ORJSONResponse, lifespan=lifespan)
+
+
+class APIGZipMiddleware(GZipMiddleware):
+    """GZip API responses, but pass media downloads through untouched."""
+
+    # Posters, videos and photos are already compressed formats; gzipping them only costs CPU
+    # and would drop their Content-Length.
+    media_path_prefixes = ("/event_poster/", "/promo_video/", "/venue_photo/")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(self.media_path_prefixes):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# JSON lists repeat the same keys in every item, so they compress very well.
+app.add_middleware(APIGZipMiddleware, minimum_size=1024, compresslevel=5)
 
 
 @app.exception_handler(ServerSelectionTimeoutError)
@@ -49,31 +92,393 @@ if not mongo_uri:
 
 # Create the MongoDB client.
 # In some serverless environments, explicitly providing a CA bundle helps prevent TLS handshake issues.
+# Pooled connections are reused so requests don't pay a TLS handshake per new socket. No idle
+# connections are held by default, since every serverless instance would keep its own against the
+# cluster's connection limit; long-running servers can raise MONGO_MIN_POOL_SIZE.
 client = motor.motor_asyncio.AsyncIOMotorClient(
     mongo_uri,
     tls=True,
     tlsCAFile=certifi.where(),
+    maxPoolSize=int(os.getenv("MONGO_MAX_POOL_SIZE", "50")),
+    minPoolSize=int(os.getenv("MONGO_MIN_POOL_SIZE", "0")),
+    maxIdleTimeMS=60000,
+    serverSelectionTimeoutMS=5000,
+    retryWrites=True,
 )
 
+class ObjectIdAsStr(TypeDecoder):
+    """Decode ObjectId values straight to strings."""
+    # MongoDB returns ObjectId, which is not JSON-serializable; decoding it as str makes documents JSON-ready.
+    bson_type = ObjectId
+
+    def transform_bson(self, value):
+        return str(value)
+
 # Reference the database that will store all API collections.
-db = client.event_management_db  # must match your Atlas database name
+db = client.get_database(
+    "event_management_db",  # must match your Atlas database name
+    codec_options=CodecOptions(type_registry=TypeRegistry([ObjectIdAsStr()])),
+)
+
+# GridFS matches chunks to files by ObjectId, so media uses a handle with the default codec options.
+media_db = client.event_management_db
+
+# Media writes are acknowledged by the primary without waiting for the journal (w=1, j=False).
+# Losing the last few uploads in a crash is acceptable for media, and it saves a journal sync per chunk.
+# CRUD collections (especially bookings) keep the connection's default, durable write concern.
+MEDIA_WRITE_CONCERN = WriteConcern(w=1, j=False)
+
+# GridFS buckets for uploaded media (one per media kind).
+# GridFS splits files into chunks, so uploads are not limited by the 16 MB BSON document cap.
+event_posters_bucket = motor.motor_asyncio.AsyncIOMotorGridFSBucket(
+    media_db, bucket_name="event_posters", write_concern=MEDIA_WRITE_CONCERN
+)
+promo_videos_bucket = motor.motor_asyncio.AsyncIOMotorGridFSBucket(
+    media_db, bucket_name="promo_videos", write_concern=MEDIA_WRITE_CONCERN
+)
+venue_photos_bucket = motor.motor_asyncio.AsyncIOMotorGridFSBucket(
+    media_db, bucket_name="venue_photos", write_concern=MEDIA_WRITE_CONCERN
+)
+
+# Buckets by name, used by the upload queue worker.
+MEDIA_BUCKETS = {
+    "event_posters": event_posters_bucket,
+    "promo_videos": promo_videos_bucket,
+    "venue_photos": venue_photos_bucket,
+}
+
+# Uploads are copied into GridFS in fixed-size pieces so memory use stays flat regardless of file size.
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Only the fields needed to build a media response are fetched from `<bucket>.files`.
+MEDIA_FILE_PROJECTION = {"filename": 1, "length": 1, "metadata.content_type": 1}
+
+# How long browsers/CDNs may reuse a downloaded media file without asking the API again.
+# A newer upload for the same event/venue can take up to this long to show up in those caches.
+MEDIA_CACHE_MAX_AGE = 86400  # 1 day
+
+# Optional: when the API runs behind nginx, set this to an `internal;` location (e.g. /protected/media)
+# and media downloads are handed off to nginx via X-Accel-Redirect instead of being proxied through Python.
+# The location must resolve `<prefix>/<bucket>/<file_id>` from GridFS; nothing in this repo provides that,
+# so leave this unset unless your nginx setup does.
+media_accel_prefix = os.getenv("MEDIA_ACCEL_REDIRECT_PREFIX", "").rstrip("/")
+
+
+# Optional Redis read-through cache for GET endpoints.
+# Leave REDIS_URL unset (e.g. on Vercel) to read straight from MongoDB.
+redis_url = os.getenv("REDIS_URL")
+cache = aioredis.Redis.from_url(redis_url) if redis_url else None
+CACHE_TTL_SECONDS = 60
+
+# Optional upload queue (requires REDIS_URL and a long-running process, so not for Vercel).
+# With QUEUE_UPLOADS=1, upload endpoints copy the file into Redis, queue a job on the `uploads` stream
+# and answer 202 right away; a background worker writes queued files to GridFS.
+queue_uploads = cache is not None and os.getenv("QUEUE_UPLOADS") == "1"
+UPLOAD_STREAM = "uploads"
+UPLOAD_GROUP = "gridfs-writers"
+UPLOAD_BLOB_TTL_SECONDS = 24 * 60 * 60  # queued bytes nobody picked up are dropped after a day
+UPLOAD_RETRY_MS = 60000  # jobs unacknowledged for this long are offered to another worker
+UPLOAD_LOCK_MS = 30000  # a worker owns a file for this long, extended after every batch it writes
+UPLOAD_COPY_BATCH = 8  # chunks fetched from Redis per round trip while writing to GridFS
+UPLOAD_BLOCK_MS = 1000  # how long XREADGROUP waits for new jobs; must stay well below the Redis socket timeout
+# OpenAPI entry for the 202 the upload routes return when the upload queue is on.
+UPLOAD_QUEUED_RESPONSES = {202: {"description": "Upload queued; it is written to GridFS in the background"}}
+
+# Only the worker holding a file's lock (identified by its consumer name) may extend or release it.
+EXTEND_LOCK_SCRIPT = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('pexpire', KEYS[1], ARGV[2]) end return 0"
+RELEASE_LOCK_SCRIPT = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end return 0"
 
 
 # -------------------------
 # Helpers
 # -------------------------
+# Stages that join each event with its venue (used by GET /events?expand=venue).
+# `venue_id` is stored as a string, so it is converted to an ObjectId before matching;
+# events whose venue_id is invalid or unknown are returned without a `venue` field instead of failing the query.
+# The expanded list is a summary view, so only the fields it needs are kept to keep pages small.
+VENUE_LOOKUP_STAGES = [
+    {
+        "$lookup": {
+            "from": "venues",
+            "let": {"venue_oid": {"$convert": {"input": "$venue_id", "to": "objectId", "onError": None, "onNull": None}}},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$_id", "$$venue_oid"]}}},
+                {"$project": {"_id": 0, "name": 1, "address": 1}},
+            ],
+            "as": "venue",
+        }
+    },
+    {"$unwind": {"path": "$venue", "preserveNullAndEmptyArrays": True}},
+    {"$project": {"name": 1, "date": 1, "venue_id": 1, "venue": 1}},
+]
+
+# Page size limits for list endpoints.
+LIST_DEFAULT_LIMIT = 50
+LIST_MAX_LIMIT = 200
+# Deeper offsets make MongoDB walk and discard that many documents (and past 2**63 can't be encoded at all).
+LIST_MAX_SKIP = 100000
+
 def oid(id_str: str) -> ObjectId:
     """Validate and convert a string to MongoDB ObjectId."""
     # Protect endpoints like /events/{id} from invalid ObjectId values.
-    if not ObjectId.is_valid(id_str):
+    # Parsing once and catching the error avoids validating the string twice.
+    try:
+        return ObjectId(id_str)
+    except (InvalidId, TypeError):
         raise HTTPException(status_code=400, detail="Invalid id format")
-    return ObjectId(id_str)
 
-def fix_id(doc: dict) -> dict:
-    """Convert _id to string for JSON responses."""
-    # MongoDB returns ObjectId, which is not JSON-serializable.
-    doc["_id"] = str(doc["_id"])
-    return doc
+async def cache_get(key: str) -> Optional[Response]:
+    """Return a response built from the cached JSON for key, or None on a miss (or when caching is off)."""
+    if cache is None:
+        return None
+    try:
+        cached = await cache.get(key)
+    except RedisError:
+        # A cache outage should only cost latency, never fail the request.
+        return None
+    # The cached bytes are already JSON, so they are sent as-is instead of being decoded and re-encoded.
+    return Response(cached, media_type="application/json") if cached is not None else None
+
+async def cache_set(key: str, value) -> None:
+    """Store a JSON-serializable value in the cache with the default TTL."""
+    if cache is None:
+        return
+    try:
+        await cache.set(key, orjson.dumps(value), ex=CACHE_TTL_SECONDS)
+    except RedisError:
+        pass
+
+async def list_page(coll, skip: int, limit: int, stages: Optional[list] = None) -> dict:
+    """Fetch one page of a collection (sorted by _id) plus its total document count."""
+    if stages is None:
+        cursor = coll.find().sort("_id", 1).skip(skip).limit(limit)
+    else:
+        # Paginate before any extra stages so they only run on the documents being returned.
+        cursor = coll.aggregate([{"$sort": {"_id": 1}}, {"$skip": skip}, {"$limit": limit}, *stages])
+    # estimated_document_count reads collection metadata instead of scanning, and runs alongside the page query.
+    docs, total = await asyncio.gather(cursor.to_list(limit), coll.estimated_document_count())
+    return {"items": docs, "total": total, "skip": skip, "limit": limit}
+
+async def list_cache_key(collection: str) -> str:
+    """Build the cache key for a collection's list endpoint."""
+    # The version is bumped on every write, so stale list entries are simply never read again.
+    version = 0
+    if cache is not None:
+        try:
+            version = int(await cache.get(f"{collection}:version") or 0)
+        except RedisError:
+            pass
+    return f"{collection}:list:{version}"
+
+async def cache_invalidate(collection: str, _id: Optional[ObjectId] = None) -> None:
+    """Drop a cached document (if given) and invalidate the collection's cached lists."""
+    if cache is None:
+        return
+    try:
+        if _id is not None:
+            await cache.delete(f"{collection}:{_id}")
+        await cache.incr(f"{collection}:version")
+    except RedisError:
+        pass
+
+async def warm_up_connection() -> None:
+    """Open the first MongoDB connection before any request needs it."""
+    # Without this, the first request pays for server discovery and the TLS handshake.
+    try:
+        await client.admin.command("ping")
+    except PyMongoError as exc:
+        logger.warning("MongoDB ping failed at startup: %s", exc)
+
+async def ensure_indexes() -> None:
+    """Create the indexes behind the API's filter/sort queries."""
+    # create_index is a no-op when the index already exists, so this is safe on every startup.
+    try:
+        # "Latest file for this event/venue" is served as an index-backed top-1 instead of a collection scan.
+        await media_db.event_posters.files.create_index([("metadata.event_id", 1), ("uploadDate", -1)])
+        await media_db.promo_videos.files.create_index([("metadata.event_id", 1), ("uploadDate", -1)])
+        await media_db.venue_photos.files.create_index([("metadata.venue_id", 1), ("uploadDate", -1)])
+        await db.bookings.create_index("event_id")
+        await db.bookings.create_index("attendee_id")
+    except PyMongoError as exc:
+        # Missing indexes only cost speed; don't stop the API from starting.
+        logger.warning("Could not create MongoDB indexes: %s", exc)
+
+async def save_upload(bucket, file: UploadFile, metadata: dict) -> ObjectId:
+    """Copy an uploaded file into a GridFS bucket chunk by chunk and return its file id."""
+    # Never hold the whole upload in memory: read and write one chunk at a time.
+    grid_in = bucket.open_upload_stream(file.filename, metadata=metadata)
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await grid_in.write(chunk)
+        await grid_in.close()
+    except BaseException:
+        # GridIn does not clean up after a failure (or a cancelled request); drop the chunks written so far.
+        await grid_in.abort()
+        raise
+    return grid_in._id
+
+async def enqueue_upload(bucket_name: str, file: UploadFile, metadata: dict) -> ObjectId:
+    """Copy an upload into Redis chunk by chunk and queue it for the GridFS worker."""
+    # The GridFS id is chosen now so the client gets it back immediately.
+    file_id = ObjectId()
+    blob_key = f"upload:{file_id}"
+    chunks = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        await cache.pipeline(transaction=False).rpush(blob_key, chunk).expire(blob_key, UPLOAD_BLOB_TTL_SECONDS).execute()
+        chunks += 1
+    await cache.xadd(
+        UPLOAD_STREAM,
+        {
+            "bucket": bucket_name,
+            "file_id": str(file_id),
+            "filename": file.filename or "",
+            "metadata": orjson.dumps(metadata),
+            "blob_key": blob_key,
+            "chunks": chunks,
+        },
+    )
+    return file_id
+
+async def upload_media(bucket_name: str, file: UploadFile, metadata: dict):
+    """Store an upload in GridFS, or queue it when the upload queue is on; returns (file_id, queued)."""
+    if queue_uploads:
+        try:
+            return await enqueue_upload(bucket_name, file, metadata), True
+        except RedisError as exc:
+            # Fall back to writing directly so a Redis outage doesn't lose the upload.
+            logger.warning("Could not queue upload, writing it directly: %s", exc)
+            await file.seek(0)
+    return await save_upload(MEDIA_BUCKETS[bucket_name], file, metadata), False
+
+async def extend_upload_lock(lock_key: str, consumer: str, file_id: ObjectId) -> None:
+    """Renew this worker's lock on a queued file, or raise if another worker has taken it over."""
+    if not await cache.eval(EXTEND_LOCK_SCRIPT, 1, lock_key, consumer, UPLOAD_LOCK_MS):
+        # Stop without touching chunks that are now the other worker's.
+        raise RuntimeError(f"Lost the lock on queued upload {file_id}")
+
+async def write_queued_upload(fields: dict, consumer: str) -> bool:
+    """Write one queued upload from Redis into GridFS; returns False if another worker owns the file."""
+    bucket_name = fields[b"bucket"].decode()
+    file_id = ObjectId(fields[b"file_id"].decode())
+    blob_key = fields[b"blob_key"].decode()
+    lock_key = f"upload-lock:{file_id}"
+    # Jobs can be handed to a second worker while the first is still writing a large file;
+    # the lock makes sure only one of them ever touches this file's chunks.
+    if not await cache.set(lock_key, consumer, nx=True, px=UPLOAD_LOCK_MS):
+        return False
+    try:
+        if await media_db[f"{bucket_name}.files"].find_one({"_id": file_id}, projection={"_id": 1}) is None:
+            # We hold the lock, so any chunks already stored for this id were left by a worker that died.
+            await media_db[f"{bucket_name}.chunks"].delete_many({"files_id": file_id})
+            chunks = int(fields[b"chunks"])
+            if await cache.llen(blob_key) != chunks:
+                # The queued bytes expired or were lost; there is nothing complete to write.
+                logger.error("Queued upload %s is incomplete in Redis; dropping it", file_id)
+            else:
+                bucket = MEDIA_BUCKETS[bucket_name]
+                metadata = orjson.loads(fields[b"metadata"])
+                filename = fields[b"filename"].decode()
+                grid_in = bucket.open_upload_stream_with_id(file_id, filename, metadata=metadata)
+                for start in range(0, chunks, UPLOAD_COPY_BATCH):
+                    await extend_upload_lock(lock_key, consumer, file_id)
+                    for chunk in await cache.lrange(blob_key, start, start + UPLOAD_COPY_BATCH - 1):
+                        await grid_in.write(chunk)
+                # Check again before close() publishes the file: the lock may have lapsed during the last batch.
+                await extend_upload_lock(lock_key, consumer, file_id)
+                await grid_in.close()
+        await cache.delete(blob_key)
+    finally:
+        await cache.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, consumer)
+    return True
+
+async def upload_worker() -> None:
+    """Consume the upload queue forever, writing each queued file to GridFS."""
+    consumer = f"{socket.gethostname()}-{os.getpid()}"
+    while True:
+        try:
+            try:
+                await cache.xgroup_create(UPLOAD_STREAM, UPLOAD_GROUP, id="0", mkstream=True)
+            except ResponseError:
+                pass  # the group already exists
+            # Take over jobs left unacknowledged for a while, then wait briefly for new ones.
+            # Redis 6.2 replies with two parts and Redis 7 with three; the messages are always the second.
+            messages = (
+                await cache.xautoclaim(UPLOAD_STREAM, UPLOAD_GROUP, consumer, min_idle_time=UPLOAD_RETRY_MS, count=1)
+            )[1]
+            if not messages:
+                entries = await cache.xreadgroup(
+                    UPLOAD_GROUP, consumer, {UPLOAD_STREAM: ">"}, count=1, block=UPLOAD_BLOCK_MS
+                )
+                messages = entries[0][1] if entries else []
+            for message_id, fields in messages:
+                try:
+                    done = await write_queued_upload(fields, consumer)
+                except Exception:
+                    # Leave the job unacknowledged; it is offered again after UPLOAD_RETRY_MS.
+                    logger.exception("Queued upload %s failed, will retry", message_id)
+                    continue
+                if done:
+                    await cache.xack(UPLOAD_STREAM, UPLOAD_GROUP, message_id)
+                    await cache.xdel(UPLOAD_STREAM, message_id)
+        except Exception:
+            # Never let the worker die silently: uploads would keep returning 202 and never be written.
+            logger.exception("Upload queue worker error; restarting")
+            await asyncio.sleep(1)
+
+async def iter_file(grid_out):
+    """Yield a GridFS file one stored chunk at a time."""
+    # Only one chunk is resident at a time, and the first bytes go out as soon as they arrive.
+    while chunk := await grid_out.readchunk():
+        yield chunk
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match header already covers etag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+def content_disposition(filename: Optional[str]) -> str:
+    """Build an inline Content-Disposition header that is safe for any uploaded filename."""
+    if not filename:
+        return "inline"
+    # Header values must be Latin-1, so non-ASCII names go in `filename*` (RFC 5987);
+    # `filename` gets a plain-ASCII fallback without quotes, backslashes or control characters.
+    fallback = "".join(c if " " <= c <= "~" and c not in '"\\' else "_" for c in filename)
+    return f"inline; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename, safe='')}"
+
+async def media_response(request: Request, bucket, bucket_name: str, doc: dict) -> Response:
+    """Build the download response for a GridFS `files` document."""
+    # Uploads sent without a part content type are served as generic binary data.
+    content_type = doc["metadata"].get("content_type") or "application/octet-stream"
+    # GridFS files never change once written, so the file id alone identifies the exact bytes.
+    cache_headers = {
+        "ETag": f'W/"{doc["_id"]}"',
+        "Cache-Control": f"public, max-age={MEDIA_CACHE_MAX_AGE}",
+    }
+    if etag_matches(request, cache_headers["ETag"]):
+        # The client already has this file.
+        return Response(status_code=304, headers=cache_headers)
+    if media_accel_prefix:
+        # Let nginx serve the bytes; the API only returns headers.
+        return Response(
+            status_code=200,
+            headers={
+                "X-Accel-Redirect": f"{media_accel_prefix}/{bucket_name}/{doc['_id']}",
+                "Content-Type": content_type,
+                "Content-Disposition": content_disposition(doc.get("filename")),
+                **cache_headers,
+            },
+        )
+    # Stream chunks back from GridFS with the stored content type.
+    grid_out = await bucket.open_download_stream(doc["_id"])
+    return StreamingResponse(
+        iter_file(grid_out),
+        media_type=content_type,
+        headers={"Content-Length": str(doc["length"]), **cache_headers},
+    )
+
 
 
 # -------------------------
@@ -106,6 +511,9 @@ class Booking(BaseModel):
     ticket_type: str = Field(..., min_length=1)
     quantity: int = Field(..., ge=1)
 
+# Upper bound on the number of documents accepted by one bulk create request.
+BULK_MAX_ITEMS = 1000
+
 
 # -------------------------
 # Root
@@ -117,238 +525,173 @@ async def root():
 
 
 # -------------------------
-# EVENTS (CRUD)
-# -------------------------
-@app.post("/events")
-async def create_event(event: Event):
-    # Insert a new event document into the `events` collection.
-    result = await db.events.insert_one(event.model_dump())
-    return {"message": "Event created", "id": str(result.inserted_id)}
-
-@app.get("/events")
-async def list_events():
-    # List up to 100 events.
-    docs = await db.events.find().to_list(100)
-    return [fix_id(d) for d in docs]
-
-@app.get("/events/{id}")
-async def get_event(id: str):
-    # Find a single event by MongoDB ObjectId.
-    doc = await db.events.find_one({"_id": oid(id)})
-    if not doc:
-        raise HTTPException(status_code=404, detail="Event not found")
-    return fix_id(doc)
-
-@app.put("/events/{id}")
-async def update_event(id: str, event: Event):
-    # Update fields for a given event by id.
-    result = await db.events.update_one({"_id": oid(id)}, {"$set": event.model_dump()})
-    if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Event not found")
-    return {"message": "Event updated"}
-
-@app.delete("/events/{id}")
-async def delete_event(id: str):
-    # Delete an event by id.
-    result = await db.events.delete_one({"_id": oid(id)})
-    if result.deleted_count == 0:
-        raise HTTPException(status_code=404, detail="Event not found")
-    return {"message": "Event deleted"}
-
-
-# -------------------------
-# ATTENDEES (CRUD)
-# -------------------------
-@app.post("/attendees")
-async def create_attendee(attendee: Attendee):
-    # Insert a new attendee into the `attendees` collection.
-    result = await db.attendees.insert_one(attendee.model_dump())
-    return {"message": "Attendee created", "id": str(result.inserted_id)}
-
-@app.get("/attendees")
-async def list_attendees():
-    # List up to 100 attendees.
-    docs = await db.attendees.find().to_list(100)
-    return [fix_id(d) for d in docs]
-
-@app.get("/attendees/{id}")
-async def get_attendee(id: str):
-    # Find a single attendee by id.
-    doc = await db.attendees.find_one({"_id": oid(id)})
-    if not doc:
-        raise HTTPException(status_code=404, detail="Attendee not found")
-    return fix_id(doc)
-
-@app.put("/attendees/{id}")
-async def update_attendee(id: str, attendee: Attendee):
-    # Update an attendee document by id.
-    result = await db.attendees.update_one({"_id": oid(id)}, {"$set": attendee.model_dump()})
-    if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Attendee not found")
-    return {"message": "Attendee updated"}
-
-@app.delete("/attendees/{id}")
-async def delete_attendee(id: str):
-    # Delete an attendee by id.
-    result = await db.attendees.delete_one({"_id": oid(id)})
-    if result.deleted_count == 0:
-        raise HTTPException(status_code=404, detail="Attendee not found")
-    return {"message": "Attendee deleted"}
-
-
-# -------------------------
-# VENUES (CRUD)
+# CRUD (events, attendees, venues, bookings)
 # -------------------------
-@app.post("/venues")
-async def create_venue(venue: Venue):
-    # Insert a new venue into the `venues` collection.
-    result = await db.venues.insert_one(venue.model_dump())
-    return {"message": "Venue created", "id": str(result.inserted_id)}
-
-@app.get("/venues")
-async def list_venues():
-    # List up to 100 venues.
-    docs = await db.venues.find().to_list(100)
-    return [fix_id(d) for d in docs]
-
-@app.get("/venues/{id}")
-async def get_venue(id: str):
-    # Find a single venue by id.
-    doc = await db.venues.find_one({"_id": oid(id)})
-    if not doc:
-        raise HTTPException(status_code=404, detail="Venue not found")
-    return fix_id(doc)
-
-@app.put("/venues/{id}")
-async def update_venue(id: str, venue: Venue):
-    # Update a venue by id.
-    result = await db.venues.update_one({"_id": oid(id)}, {"$set": venue.model_dump()})
-    if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Venue not found")
-    return {"message": "Venue updated"}
-
-@app.delete("/venues/{id}")
-async def delete_venue(id: str):
-    # Delete a venue by id.
-    result = await db.venues.delete_one({"_id": oid(id)})
-    if result.deleted_count == 0:
-        raise HTTPException(status_code=404, detail="Venue not found")
-    return {"message": "Venue deleted"}
-
-
-# -------------------------
-# BOOKINGS (CRUD)
-# -------------------------
-@app.post("/bookings")
-async def create_booking(booking: Booking):
-    # Insert a new booking into the `bookings` collection.
-    result = await db.bookings.insert_one(booking.model_dump())
-    return {"message": "Booking created", "id": str(result.inserted_id)}
-
-@app.get("/bookings")
-async def list_bookings():
-    # List up to 100 bookings.
-    docs = await db.bookings.find().to_list(100)
-    return [fix_id(d) for d in docs]
-
-@app.get("/bookings/{id}")
-async def get_booking(id: str):
-    # Find a single booking by id.
-    doc = await db.bookings.find_one({"_id": oid(id)})
-    if not doc:
-        raise HTTPException(status_code=404, detail="Booking not found")
-    return fix_id(doc)
-
-@app.put("/bookings/{id}")
-async def update_booking(id: str, booking: Booking):
-    # Update booking fields by id.
-    result = await db.bookings.update_one({"_id": oid(id)}, {"$set": booking.model_dump()})
-    if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Booking not found")
-    return {"message": "Booking updated"}
-
-@app.delete("/bookings/{id}")
-async def delete_booking(id: str):
-    # Delete a booking by id.
-    result = await db.bookings.delete_one({"_id": oid(id)})
-    if result.deleted_count == 0:
-        raise HTTPException(status_code=404, detail="Booking not found")
-    return {"message": "Booking deleted"}
+def make_crud(name: str, label: str, model, include_list: bool = True) -> None:
+    """Register the create/bulk/list/get/update/delete routes for one collection."""
+    # Everything the handlers need is resolved once here, not on every request.
+    coll = db[name]
+    insert_one = coll.insert_one
+    insert_many = coll.insert_many
+    find_one = coll.find_one
+    update_one = coll.update_one
+    delete_one = coll.delete_one
+    dump = TypeAdapter(model).dump_python
+    singular = label.lower()
+    not_found = f"{label} not found"
+
+    @app.post(f"/{name}", name=f"create_{singular}", status_code=201, response_class=Response)
+    async def create(item: model):
+        # Insert a new document into the collection; the new id is returned in the Location header.
+        result = await insert_one(dump(item))
+        await cache_invalidate(name)
+        return Response(status_code=201, headers={"Location": f"/{name}/{result.inserted_id}"})
+
+    @app.post(f"/{name}:bulk", name=f"create_{name}_bulk", status_code=201)
+    async def create_bulk(items: List[model] = Body(..., min_length=1, max_length=BULK_MAX_ITEMS)):
+        # Insert many documents in one round trip; unordered inserts let the server apply them in parallel.
+        result = await insert_many([dump(item) for item in items], ordered=False)
+        await cache_invalidate(name)
+        return {"message": f"{label}s created", "ids": [str(i) for i in result.inserted_ids]}
+
+    if include_list:
+        @app.get(f"/{name}", name=f"list_{name}")
+        async def list_all(
+            skip: int = Query(0, ge=0, le=LIST_MAX_SKIP),
+            limit: int = Query(LIST_DEFAULT_LIMIT, ge=1, le=LIST_MAX_LIMIT),
+        ):
+            # List one page of documents.
+            key = f"{await list_cache_key(name)}:{skip}:{limit}"
+            cached = await cache_get(key)
+            if cached is not None:
+                return cached
+            page = await list_page(coll, skip, limit)
+            await cache_set(key, page)
+            return page
+
+    @app.get(f"/{name}/{{id}}", name=f"get_{singular}")
+    async def get(id: str):
+        # Find a single document by MongoDB ObjectId.
+        _id = oid(id)
+        key = f"{name}:{_id}"
+        cached = await cache_get(key)
+        if cached is not None:
+            return cached
+        doc = await find_one({"_id": _id})
+        if not doc:
+            raise HTTPException(status_code=404, detail=not_found)
+        await cache_set(key, doc)
+        return doc
+
+    @app.put(f"/{name}/{{id}}", name=f"update_{singular}", status_code=204, response_class=Response)
+    async def update(id: str, item: model):
+        # Update fields for a given document by id.
+        _id = oid(id)
+        result = await update_one({"_id": _id}, {"$set": dump(item)})
+        if result.matched_count == 0:
+            raise HTTPException(status_code=404, detail=not_found)
+        await cache_invalidate(name, _id)
+        return Response(status_code=204)
+
+    @app.delete(f"/{name}/{{id}}", name=f"delete_{singular}", status_code=204, response_class=Response)
+    async def delete(id: str):
+        # Delete a document by id.
+        _id = oid(id)
+        result = await delete_one({"_id": _id})
+        if result.deleted_count == 0:
+            raise HTTPException(status_code=404, detail=not_found)
+        await cache_invalidate(name, _id)
+        return Response(status_code=204)
+
+
+# GET /events has its own list handler below because it supports ?expand=venue.
+make_crud("events", "Event", Event, include_list=False)
+make_crud("attendees", "Attendee", Attendee)
+make_crud("venues", "Venue", Venue)
+make_crud("bookings", "Booking", Booking)
+
+
+@app.get("/events", name="list_events")
+async def list_events(
+    skip: int = Query(0, ge=0, le=LIST_MAX_SKIP),
+    limit: int = Query(LIST_DEFAULT_LIMIT, ge=1, le=LIST_MAX_LIMIT),
+    expand: Optional[Literal["venue"]] = Query(None),
+):
+    # List one page of events.
+    # With ?expand=venue each event also carries its venue, joined in the same round trip.
+    key = f"{await list_cache_key('events')}:{skip}:{limit}"
+    if expand == "venue":
+        # The expanded list depends on both collections, so both versions are part of the key.
+        key = f"{key}:venue:{await list_cache_key('venues')}"
+    cached = await cache_get(key)
+    if cached is not None:
+        return cached
+    page = await list_page(db.events, skip, limit, VENUE_LOOKUP_STAGES if expand == "venue" else None)
+    await cache_set(key, page)
+    return page
 
 
 # -------------------------
-# FILES: Upload + Retrieve (stream)
+# FILES: Upload + Retrieve (GridFS, stream)
 # -------------------------
-@app.post("/upload_event_poster/{event_id}")
+@app.post("/upload_event_poster/{event_id}", responses=UPLOAD_QUEUED_RESPONSES)
 async def upload_event_poster(event_id: str, file: UploadFile = File(...)):
-    # Read the uploaded file into memory (bytes).
-    content = await file.read()
-    # Store bytes + metadata in MongoDB.
-    doc = {
-        "event_id": event_id,
-        "filename": file.filename,
-        "content_type": file.content_type,
-        "content": content,
-        "uploaded_at": datetime.utcnow(),
-    }
-    result = await db.event_posters.insert_one(doc)
-    return {"message": "Event poster uploaded", "id": str(result.inserted_id)}
+    # Store the file in GridFS; only metadata lives in `event_posters.files`.
+    file_id, queued = await upload_media("event_posters", file, {"event_id": event_id, "content_type": file.content_type})
+    if queued:
+        return ORJSONResponse(status_code=202, content={"message": "Event poster queued", "id": str(file_id)})
+    return {"message": "Event poster uploaded", "id": str(file_id)}
 
 @app.get("/event_poster/{event_id}")
-async def get_event_poster(event_id: str):
+async def get_event_poster(event_id: str, request: Request):
     # Fetch the most recently uploaded poster for this event.
-    doc = await db.event_posters.find_one({"event_id": event_id}, sort=[("uploaded_at", -1)])
+    doc = await media_db.event_posters.files.find_one(
+        {"metadata.event_id": event_id},
+        projection=MEDIA_FILE_PROJECTION,
+        sort=[("uploadDate", -1)],
+    )
     if not doc:
         raise HTTPException(status_code=404, detail="Poster not found")
-    # Stream bytes back with the stored content type.
-    return StreamingResponse(io.BytesIO(doc["content"]), media_type=doc["content_type"])
+    return await media_response(request, event_posters_bucket, "event_posters", doc)
 
 
-@app.post("/upload_promo_video/{event_id}")
+@app.post("/upload_promo_video/{event_id}", responses=UPLOAD_QUEUED_RESPONSES)
 async def upload_promo_video(event_id: str, file: UploadFile = File(...)):
-    # Read the uploaded file into memory (bytes).
-    content = await file.read()
-    # Store bytes + metadata in MongoDB.
-    doc = {
-        "event_id": event_id,
-        "filename": file.filename,
-        "content_type": file.content_type,
-        "content": content,
-        "uploaded_at": datetime.utcnow(),
-    }
-    result = await db.promo_videos.insert_one(doc)
-    return {"message": "Promo video uploaded", "id": str(result.inserted_id)}
+    # Store the file in GridFS; only metadata lives in `promo_videos.files`.
+    file_id, queued = await upload_media("promo_videos", file, {"event_id": event_id, "content_type": file.content_type})
+    if queued:
+        return ORJSONResponse(status_code=202, content={"message": "Promo video queued", "id": str(file_id)})
+    return {"message": "Promo video uploaded", "id": str(file_id)}
 
 @app.get("/promo_video/{event_id}")
-async def get_promo_video(event_id: str):
+async def get_promo_video(event_id: str, request: Request):
     # Fetch the most recently uploaded promo video for this event.
-    doc = await db.promo_videos.find_one({"event_id": event_id}, sort=[("uploaded_at", -1)])
+    doc = await media_db.promo_videos.files.find_one(
+        {"metadata.event_id": event_id},
+        projection=MEDIA_FILE_PROJECTION,
+        sort=[("uploadDate", -1)],
+    )
     if not doc:
         raise HTTPException(status_code=404, detail="Promo video not found")
-    # Stream bytes back with the stored content type.
-    return StreamingResponse(io.BytesIO(doc["content"]), media_type=doc["content_type"])
+    return await media_response(request, promo_videos_bucket, "promo_videos", doc)
 
 
-@app.post("/upload_venue_photo/{venue_id}")
+@app.post("/upload_venue_photo/{venue_id}", responses=UPLOAD_QUEUED_RESPONSES)
 async def upload_venue_photo(venue_id: str, file: UploadFile = File(...)):
-    # Read the uploaded file into memory (bytes).
-    content = await file.read()
-    # Store bytes + metadata in MongoDB.
-    doc = {
-        "venue_id": venue_id,
-        "filename": file.filename,
-        "content_type": file.content_type,
-        "content": content,
-        "uploaded_at": datetime.utcnow(),
-    }
-    result = await db.venue_photos.insert_one(doc)
-    return {"message": "Venue photo uploaded", "id": str(result.inserted_id)}
+    # Store the file in GridFS; only metadata lives in `venue_photos.files`.
+    file_id, queued = await upload_media("venue_photos", file, {"venue_id": venue_id, "content_type": file.content_type})
+    if queued:
+        return ORJSONResponse(status_code=202, content={"message": "Venue photo queued", "id": str(file_id)})
+    return {"message": "Venue photo uploaded", "id": str(file_id)}
 
 @app.get("/venue_photo/{venue_id}")
-async def get_venue_photo(venue_id: str):
+async def get_venue_photo(venue_id: str, request: Request):
     # Fetch the most recently uploaded venue photo.
-    doc = await db.venue_photos.find_one({"venue_id": venue_id}, sort=[("uploaded_at", -1)])
+    doc = await media_db.venue_photos.files.find_one(
+        {"metadata.venue_id": venue_id},
+        projection=MEDIA_FILE_PROJECTION,
+        sort=[("uploadDate", -1)],
+    )
     if not doc:
         raise HTTPException(status_code=404, detail="Venue photo not found")
-    # Stream bytes back with the stored content type.
-    return StreamingResponse(io.BytesIO(doc["content"]), media_type=doc["content_type"])
+    return await media_response(request, venue_photos_bucket, "venue_photos", doc)
@@ -0,0 +1,50 @@
+"""One-off migration: copy media stored inline in MongoDB documents into the GridFS buckets.
+
+Before GridFS, uploads were stored as single documents (with the bytes in `content`) in the plain
+`event_posters`, `promo_videos` and `venue_photos` collections. The API now only reads GridFS,
+so run this once after deploying:
+
+    python migrate_media_to_gridfs.py
+
+It is safe to re-run: files that were already copied are skipped. The old documents are left in place.
+"""
+import asyncio  # Run the async Motor calls from a script
+import io  # Wrap the stored bytes in a stream for GridFS
+
+# Field that links each media kind to its event/venue.
+OWNER_FIELDS = {
+    "event_posters": "event_id",
+    "promo_videos": "event_id",
+    "venue_photos": "venue_id",
+}
+
+
+async def migrate() -> None:
+    # Import inside the running event loop so the Motor client binds to it.
+    import main
+
+    for bucket_name, owner_field in OWNER_FIELDS.items():
+        bucket = main.MEDIA_BUCKETS[bucket_name]
+        files = main.media_db[f"{bucket_name}.files"]
+        copied = skipped = 0
+        async for legacy in main.media_db[bucket_name].find({"content": {"$exists": True}}):
+            # The old document id is reused as the GridFS file id, which makes re-runs idempotent.
+            if await files.find_one({"_id": legacy["_id"]}, projection={"_id": 1}):
+                skipped += 1
+            else:
+                # Drop chunks left by an earlier run that stopped mid-file.
+                await main.media_db[f"{bucket_name}.chunks"].delete_many({"files_id": legacy["_id"]})
+                await bucket.upload_from_stream_with_id(
+                    legacy["_id"],
+                    legacy.get("filename"),
+                    io.BytesIO(legacy["content"]),
+                    metadata={owner_field: legacy[owner_field], "content_type": legacy.get("content_type")},
+                )
+                copied += 1
+            # Keep the original upload time so "latest file" lookups still pick the right one.
+            await files.update_one({"_id": legacy["_id"]}, {"$set": {"uploadDate": legacy["uploaded_at"]}})
+        print(f"{bucket_name}: copied {copied}, already migrated {skipped}")
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate())